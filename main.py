@@ -1,11 +1,63 @@
+import argparse
+import hashlib
+import inspect
 import os
+import pickle
+import numpy as np
 import pandas as pd
 from src.data_loader import load_forward_curve
 from src.optimizer import optimize_ugs_plan
 from src.strategy import calculate_bid_and_plan
-from src.visualization import plot_results
+
+CACHE_DIR = ".cache"
+
+def optimize_with_cache(forward_curve: pd.DataFrame, use_cache: bool = True, **params) -> dict:
+    """
+    Run optimize_ugs_plan, reusing a pickled result for an identical forward curve.
+    
+    The cache key covers the curve, the optimizer parameters and the source
+    of src/optimizer.py, so entries go stale when the model changes.
+    
+    Args:
+        forward_curve: DataFrame with columns ['date', 'price', 'day_index'].
+        use_cache: Whether to read and write the cache.
+        **params: Keyword arguments passed on to optimize_ugs_plan.
+        
+    Returns:
+        Result from optimize_ugs_plan.
+    """
+    if not use_cache:
+        return optimize_ugs_plan(forward_curve, **params)
+    
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(forward_curve["date"].to_numpy(dtype="datetime64[ns]").tobytes())
+    digest.update(forward_curve["price"].to_numpy(dtype=float).tobytes())
+    digest.update(repr(sorted(params.items())).encode())
+    with open(inspect.getsourcefile(optimize_ugs_plan), "rb") as f:
+        digest.update(f.read())
+    cache_path = os.path.join(CACHE_DIR, f"ugs_{digest.hexdigest()}.pkl")
+    
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+        except (pickle.UnpicklingError, EOFError):
+            pass  # Corrupt or partially written entry: re-solve and overwrite it
+    
+    optimization_result = optimize_ugs_plan(forward_curve, **params)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(cache_path, "wb") as f:
+        pickle.dump(optimization_result, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return optimization_result
 
 def main():
+    parser = argparse.ArgumentParser(description="Optimize the UGS injection/withdrawal plan and bid.")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Re-run the optimization instead of reusing results cached in {CACHE_DIR}/")
+    parser.add_argument("--no-plot", action="store_true",
+                        help="Skip generating results/ugs_plan.png")
+    args = parser.parse_args()
+    
     print(f"Current working directory: {os.getcwd()}")
     
     print("Loading forward curve...")
@@ -13,14 +65,11 @@ def main():
     forward_curve, _ = load_forward_curve(data_path)
     
     print("Optimizing injection/withdrawal plan...")
-    optimization_result = optimize_ugs_plan(forward_curve)
+    optimization_result = optimize_with_cache(forward_curve, use_cache=not args.no_cache)
     
     print("Calculating bid and plan...")
     result = calculate_bid_and_plan(optimization_result, bid_fraction=0.8)
     
-    # Debug: Print result dictionary (optional, can remove after verification)
-    print("Result dictionary:", result)
-    
     print("\n=== UGS Auction Results ===")
     print(f"Intrinsic Value: {result['intrinsic_value']:.2f} € ({result['intrinsic_value_per_mwh']:.3f} €/MWh)")
     print(f"Bid: {result['bid_total']:.2f} € ({result['bid_per_mwh']:.3f} €/MWh)")
@@ -41,14 +90,22 @@ def main():
     os.makedirs("results", exist_ok=True)
     plan_csv_path = "results/ugs_plan.csv"
     plan = result["plan"]
-    plan["gain_loss"] = plan["withdraw"] * plan["price"] - plan["inject"] * plan["price"] * 1.012
-    plan["storage_change"] = plan["storage"].diff().fillna(plan["storage"])
-    plan.to_csv(plan_csv_path, index=False)
+    inj, wd, st, p = plan["inject"], plan["withdraw"], plan["storage"], plan["price"]
+    columns = {
+        **plan,
+        "gain_loss": wd * p - inj * p * 1.012,
+        "storage_change": np.diff(st, prepend=0.0)
+    }
+    pd.DataFrame.from_dict(columns, orient="columns").to_csv(plan_csv_path, index=False)
     print(f"Plan saved to {plan_csv_path}")
     
-    print("Generating plots...")
-    plot_results(result, save_dir="results")
-    print("Plots saved to results/ugs_plan.png")
+    if not args.no_plot:
+        # Imported here so runs without plots don't pay for loading matplotlib
+        from src.visualization import plot_results
+        
+        print("Generating plots...")
+        plot_results(result, save_dir="results")
+        print("Plots saved to results/ugs_plan.png")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,253 @@
+# src/greedy.py
+"""
+Merit-order heuristic for the UGS intrinsic value, JIT-compiled with Numba.
+"""
+
+import numba
+import numpy as np
+import pandas as pd
+from typing import Tuple, Dict
+from src.optimizer import _curve_coefficients
+
+@numba.njit(cache=True)
+def _merit_order_pairing(prices: np.ndarray,
+                         cost_coef: np.ndarray,
+                         sorted_idx: np.ndarray,
+                         inject_cap: np.ndarray,
+                         withdraw_cap: np.ndarray,
+                         wgv: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pair the cheapest injection days with the dearest later withdrawal days.
+    
+    Args:
+        prices: Daily prices.
+        cost_coef: Daily injection cost per MWh (price plus variable cost).
+        sorted_idx: Day indices sorted by ascending price.
+        inject_cap: Daily injection rate caps.
+        withdraw_cap: Daily withdrawal rate caps.
+        wgv: Working gas volume (MWh).
+        
+    Returns:
+        Tuple of (inject, withdraw, storage) arrays.
+    """
+    T = len(prices)
+    inject = np.zeros(T)
+    withdraw = np.zeros(T)
+    storage = np.zeros(T)
+    
+    for i in range(T):
+        buy = sorted_idx[i]
+        for j in range(T - 1, -1, -1):
+            sell = sorted_idx[j]
+            if prices[sell] <= cost_coef[buy]:
+                break  # No profitable withdrawal day left for this buy day
+            if sell <= buy or withdraw[sell] >= withdraw_cap[sell]:
+                continue
+            # Gas is held from the buy day until the day before the sale
+            volume = min(inject_cap[buy] - inject[buy],
+                         withdraw_cap[sell] - withdraw[sell],
+                         wgv - storage[buy:sell].max())
+            if volume > 0:
+                inject[buy] += volume
+                withdraw[sell] += volume
+                storage[buy:sell] += volume
+            if inject[buy] >= inject_cap[buy]:
+                break
+    
+    return inject, withdraw, storage
+
+
+@numba.njit(cache=True)
+def _replay_plan(inject: np.ndarray,
+                 withdraw: np.ndarray,
+                 wgv: float,
+                 curve: Tuple[float, float, float, float, float]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Clip a plan day by day to the caps implied by its own storage path.
+    
+    Args:
+        inject: Planned daily injections.
+        withdraw: Planned daily withdrawals.
+        wgv: Working gas volume (MWh).
+        curve: Rate cap coefficients from _curve_coefficients.
+        
+    Returns:
+        Tuple of feasible (inject, withdraw, storage) arrays.
+    """
+    inject_max, inject_intercept, injection_slope, withdraw_intercept, withdrawal_slope = curve
+    T = len(inject)
+    inject = inject.copy()
+    withdraw = withdraw.copy()
+    storage = np.empty(T)
+    level = 0.0
+    for t in range(T):
+        inject_cap = max(min(inject_max, inject_intercept - injection_slope * level), 0.0)
+        withdraw_cap = withdraw_intercept + withdrawal_slope * level
+        inject[t] = min(inject[t], inject_cap, wgv - level)
+        withdraw[t] = min(withdraw[t], withdraw_cap, level)
+        level += inject[t] - withdraw[t]
+        storage[t] = level
+    return inject, withdraw, storage
+
+
+@numba.njit(cache=True)
+def _greedy_plan(prices: np.ndarray,
+                 cost_coef: np.ndarray,
+                 sorted_idx: np.ndarray,
+                 wgv: float,
+                 curve: Tuple[float, float, float, float, float],
+                 max_passes: int) -> Tuple[float, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Run the merit-order pairing until the storage path is stable.
+    
+    Returns:
+        Tuple of (profit, inject, withdraw, storage) for the best feasible plan.
+    """
+    inject_max, inject_intercept, injection_slope, withdraw_intercept, withdrawal_slope = curve
+    T = len(prices)
+    best_profit = -np.inf
+    best_inject = np.zeros(T)
+    best_withdraw = np.zeros(T)
+    best_storage = np.zeros(T)
+    
+    storage_prev = np.zeros(T)
+    for _ in range(max_passes):
+        inject_cap = np.maximum(np.minimum(inject_max, inject_intercept - injection_slope * storage_prev), 0.0)
+        withdraw_cap = withdraw_intercept + withdrawal_slope * storage_prev
+        inject, withdraw, storage = _merit_order_pairing(
+            prices, cost_coef, sorted_idx, inject_cap, withdraw_cap, wgv
+        )
+        
+        feasible_inject, feasible_withdraw, feasible_storage = _replay_plan(inject, withdraw, wgv, curve)
+        profit = np.dot(feasible_withdraw, prices) - np.dot(feasible_inject, cost_coef)
+        if profit > best_profit:
+            best_profit = profit
+            best_inject = feasible_inject
+            best_withdraw = feasible_withdraw
+            best_storage = feasible_storage
+        
+        next_storage_prev = np.zeros(T)
+        next_storage_prev[1:] = storage[:-1]
+        if np.all(np.abs(next_storage_prev - storage_prev) <= 1e-8 + 1e-5 * np.abs(storage_prev)):
+            break
+        storage_prev = next_storage_prev
+    
+    return best_profit, best_inject, best_withdraw, best_storage
+
+
+@numba.njit(cache=True, parallel=True)
+def _greedy_values(price_scenarios: np.ndarray,
+                   cost_scenarios: np.ndarray,
+                   sorted_idx: np.ndarray,
+                   wgv: float,
+                   curve: Tuple[float, float, float, float, float],
+                   max_passes: int) -> np.ndarray:
+    """
+    Greedy intrinsic value of each scenario (one per row), in parallel.
+    """
+    n = price_scenarios.shape[0]
+    profits = np.empty(n)
+    for k in numba.prange(n):
+        profits[k] = _greedy_plan(
+            price_scenarios[k], cost_scenarios[k], sorted_idx[k], wgv, curve, max_passes
+        )[0]
+    return profits
+
+
+def optimize_ugs_plan_greedy(forward_curve: pd.DataFrame,
+                             wgv: float = 1_000_000,
+                             max_injection_rate: float = 20_000,
+                             max_withdrawal_rate: float = 30_000,
+                             injection_threshold: float = 0.5,
+                             injection_first_half: float = 1.0,
+                             injection_second_half: float = 0.7,
+                             withdrawal_min_factor: float = 0.4,
+                             withdrawal_max_factor: float = 1.0,
+                             variable_cost_rate: float = 0.012,
+                             max_passes: int = 5) -> Dict:
+    """
+    Approximate the intrinsic value with a merit-order heuristic instead of an LP.
+    
+    Buy days are matched with the most expensive later sell days, subject to
+    the storage capacity. Since the rate caps depend on the storage level, the
+    pairing is repeated with caps recomputed from the previous storage path
+    until the path is stable (at most max_passes times). Each candidate plan
+    is then replayed day by day against the exact caps so the returned plan
+    is always feasible, and the most profitable one is kept.
+    
+    Args:
+        forward_curve: DataFrame with columns ['date', 'price', 'day_index'].
+        wgv: Working gas volume (MWh).
+        max_injection_rate: Maximum injection rate (MWh/day).
+        max_withdrawal_rate: Maximum withdrawal rate (MWh/day).
+        injection_threshold: Storage fill percentage for injection curve.
+        injection_first_half: Injection rate factor when < threshold.
+        injection_second_half: Injection rate factor when >= threshold.
+        withdrawal_min_factor: Withdrawal rate factor when empty.
+        withdrawal_max_factor: Withdrawal rate factor when full.
+        variable_cost_rate: Variable cost as fraction of injected gas cost.
+        max_passes: Maximum number of pairing passes.
+        
+    Returns:
+        Dictionary with results: profit, plan (dict of NumPy arrays), and
+        status ("Feasible", since the heuristic does not prove optimality).
+        The profit is a lower bound on the LP value. calculate_bid_and_plan
+        only accepts "Optimal" results, so this one cannot be passed to it
+        directly.
+    """
+    # Extract data
+    prices = forward_curve['price'].to_numpy(dtype=float)
+    T = len(forward_curve)
+    cost_coef = prices * (1 + variable_cost_rate)
+    sorted_idx = np.argsort(prices, kind='stable')
+    curve = _curve_coefficients(wgv, max_injection_rate, max_withdrawal_rate, injection_threshold,
+                                injection_first_half, injection_second_half,
+                                withdrawal_min_factor, withdrawal_max_factor)
+    
+    profit, inject, withdraw, storage = _greedy_plan(prices, cost_coef, sorted_idx, wgv, curve, max_passes)
+    
+    plan = {
+        "day_index": np.arange(T),
+        "date": forward_curve['date'].to_numpy(),
+        "price": prices,
+        "inject": inject,
+        "withdraw": withdraw,
+        "storage": storage
+    }
+    
+    return {
+        "status": "Feasible",
+        "profit": float(profit),
+        "plan": plan
+    }
+
+
+def value_ugs_scenarios(price_scenarios: np.ndarray,
+                        wgv: float = 1_000_000,
+                        max_injection_rate: float = 20_000,
+                        max_withdrawal_rate: float = 30_000,
+                        injection_threshold: float = 0.5,
+                        injection_first_half: float = 1.0,
+                        injection_second_half: float = 0.7,
+                        withdrawal_min_factor: float = 0.4,
+                        withdrawal_max_factor: float = 1.0,
+                        variable_cost_rate: float = 0.012,
+                        max_passes: int = 5) -> np.ndarray:
+    """
+    Greedy intrinsic value of many forward-curve scenarios (e.g. Monte Carlo).
+    
+    Args:
+        price_scenarios: Array of shape (n_scenarios, n_days) with daily prices.
+        Other arguments: See optimize_ugs_plan_greedy.
+        
+    Returns:
+        Array of shape (n_scenarios,) with the intrinsic value of each scenario.
+    """
+    price_scenarios = np.ascontiguousarray(np.atleast_2d(price_scenarios), dtype=float)
+    cost_scenarios = price_scenarios * (1 + variable_cost_rate)
+    sorted_idx = np.argsort(price_scenarios, axis=1, kind='stable')
+    curve = _curve_coefficients(wgv, max_injection_rate, max_withdrawal_rate, injection_threshold,
+                                injection_first_half, injection_second_half,
+                                withdrawal_min_factor, withdrawal_max_factor)
+    
+    return _greedy_values(price_scenarios, cost_scenarios, sorted_idx, wgv, curve, max_passes)
@@ -3,10 +3,222 @@
 Linear programming model for UGS auction optimization.
 """
 
-import pulp
+import highspy
+import numpy as np
 import pandas as pd
+import scipy.sparse as sp
 from typing import Tuple, Dict, List
-import numpy as np
+
+def _curve_coefficients(wgv: float,
+                        max_injection_rate: float,
+                        max_withdrawal_rate: float,
+                        injection_threshold: float,
+                        injection_first_half: float,
+                        injection_second_half: float,
+                        withdrawal_min_factor: float,
+                        withdrawal_max_factor: float) -> Tuple[float, float, float, float, float]:
+    """
+    Express the injection/withdrawal curves as coefficients of the rate caps.
+    
+    With s the storage level at the end of the previous day:
+    inject_cap = max(0, min(inject_max, inject_intercept - injection_slope * s))
+    withdraw_cap = withdraw_intercept + withdrawal_slope * s
+    
+    Returns:
+        Tuple of (inject_max, inject_intercept, injection_slope,
+        withdraw_intercept, withdrawal_slope).
+    """
+    threshold_volume = injection_threshold * wgv
+    injection_slope = max_injection_rate * (injection_first_half - injection_second_half) / threshold_volume
+    return (
+        max_injection_rate * injection_first_half,
+        max_injection_rate * injection_second_half + injection_slope * threshold_volume,
+        injection_slope,
+        max_withdrawal_rate * withdrawal_min_factor,
+        max_withdrawal_rate * (withdrawal_max_factor - withdrawal_min_factor) / wgv,
+    )
+
+
+class UGSModel:
+    """
+    UGS storage LP built once and re-solved for any number of price curves.
+    
+    The constraint matrix only depends on the storage parameters, so it is
+    passed to HiGHS once; each solve() only replaces the objective
+    coefficients, and HiGHS warm-starts from the previous optimal basis.
+    """
+    
+    def __init__(self,
+                 num_days: int,
+                 wgv: float = 1_000_000,
+                 max_injection_rate: float = 20_000,
+                 max_withdrawal_rate: float = 30_000,
+                 injection_threshold: float = 0.5,
+                 injection_first_half: float = 1.0,
+                 injection_second_half: float = 0.7,
+                 withdrawal_min_factor: float = 0.4,
+                 withdrawal_max_factor: float = 1.0,
+                 variable_cost_rate: float = 0.012):
+        """
+        Build the LP and pass it to HiGHS.
+        
+        Args:
+            num_days: Number of days in the storage period.
+            Other arguments: See optimize_ugs_plan.
+        """
+        T = num_days
+        self.num_days = T
+        self.variable_cost_rate = variable_cost_rate
+        inject_max, inject_intercept, injection_slope, withdraw_intercept, withdrawal_slope = _curve_coefficients(
+            wgv, max_injection_rate, max_withdrawal_rate, injection_threshold,
+            injection_first_half, injection_second_half, withdrawal_min_factor, withdrawal_max_factor
+        )
+        
+        # Variables, laid out as column blocks [inject | withdraw | storage]
+        days = np.arange(T)
+        inject = days
+        withdraw = T + days
+        storage = 2 * T + days
+        # Storage starts empty, so day 0 has no previous-storage term (-1 marks
+        # a missing column and is dropped when the matrix is assembled)
+        storage_prev = np.where(days > 0, 2 * T + days - 1, -1)
+        num_cols = 3 * T
+        
+        col_lower = np.zeros(num_cols)
+        col_upper = np.concatenate([
+            np.full(T, inject_max),  # Injection rate, first half of the curve
+            np.full(T, highspy.kHighsInf),
+            np.full(T, wgv),
+        ])
+        
+        # Constraints
+        # Each block adds one row per day, given as (columns, coefficient) terms
+        # and row bounds; the blocks are stacked into a single sparse matrix.
+        blocks = []
+        
+        # 1. Storage balance: storage[t] = storage[t-1] + inject[t] - withdraw[t]
+        blocks.append((
+            [(storage, 1.0), (storage_prev, -1.0), (inject, -1.0), (withdraw, 1.0)],
+            0.0, 0.0
+        ))
+        
+        # 2. Injection constraints (based on storage level)
+        # The rate cap drops from injection_first_half to injection_second_half as
+        # storage reaches the threshold; model it with two linear cuts instead of
+        # binaries so the problem stays a pure LP. The first cut is the column
+        # upper bound on inject above.
+        blocks.append(([(inject, 1.0), (storage_prev, injection_slope)], -highspy.kHighsInf, inject_intercept))
+        # Ensure injection doesn't exceed available capacity
+        blocks.append(([(inject, 1.0), (storage_prev, 1.0)], -highspy.kHighsInf, wgv))
+        
+        # 3. Withdrawal constraints (linear based on storage level)
+        # The fill percentage storage[t-1] / wgv is substituted directly into the
+        # rate cap, so no auxiliary variable is needed.
+        blocks.append(([(withdraw, 1.0), (storage_prev, -withdrawal_slope)], -highspy.kHighsInf, withdraw_intercept))
+        blocks.append(([(withdraw, 1.0), (storage_prev, -1.0)], -highspy.kHighsInf, 0.0))
+        
+        rows, cols, vals, row_lower, row_upper = [], [], [], [], []
+        for b, (terms, lower, upper) in enumerate(blocks):
+            for columns, coef in terms:
+                rows.append(b * T + days)
+                cols.append(columns)
+                vals.append(np.broadcast_to(coef, (T,)))
+            row_lower.append(np.full(T, lower))
+            row_upper.append(np.full(T, upper))
+        rows, cols, vals = np.concatenate(rows), np.concatenate(cols), np.concatenate(vals)
+        nonzero = (cols >= 0) & (vals != 0)
+        num_rows = len(blocks) * T
+        A = sp.csc_matrix((vals[nonzero], (rows[nonzero], cols[nonzero])), shape=(num_rows, num_cols))
+        
+        # Pass the model to HiGHS as column-wise arrays; the objective is set in solve()
+        lp = highspy.HighsLp()
+        lp.num_col_ = num_cols
+        lp.num_row_ = num_rows
+        lp.sense_ = highspy.ObjSense.kMaximize
+        lp.col_cost_ = np.zeros(num_cols)
+        lp.col_lower_ = col_lower
+        lp.col_upper_ = col_upper
+        lp.row_lower_ = np.concatenate(row_lower)
+        lp.row_upper_ = np.concatenate(row_upper)
+        lp.a_matrix_.format_ = highspy.MatrixFormat.kColwise
+        lp.a_matrix_.start_ = A.indptr
+        lp.a_matrix_.index_ = A.indices
+        lp.a_matrix_.value_ = A.data
+        
+        self._highs = highspy.Highs()
+        self._highs.setOptionValue("output_flag", False)  # Suppress solver output
+        self._highs.passModel(lp)
+        self._cost_cols = np.arange(2 * T, dtype=np.int32)  # inject and withdraw columns
+    
+    def solve(self, prices: np.ndarray, dates: np.ndarray = None) -> Dict:
+        """
+        Optimize the plan for one price curve.
+        
+        Args:
+            prices: Daily prices, one per day of the model.
+            dates: Optional dates to include in the plan.
+            
+        Returns:
+            Dictionary with optimization results: profit, plan, and status. The
+            plan is a dict of NumPy arrays keyed by column name.
+        """
+        prices = np.asarray(prices, dtype=float)
+        T = self.num_days
+        if len(prices) != T:
+            raise ValueError(f"Expected {T} prices, got {len(prices)}")
+        
+        # Objective: Maximize profit
+        # Profit = Revenue from withdrawals - Cost of injections - Variable costs
+        cost_coef = prices * (1 + self.variable_cost_rate)
+        
+        # Gas can only be withdrawn after it was injected, so if no day's price
+        # beats the cheapest earlier injection cost (and injecting is never paid
+        # for), doing nothing is optimal and the solver can be skipped.
+        if (cost_coef >= 0).all() and not (prices[1:] > np.minimum.accumulate(cost_coef)[:-1]).any():
+            idle = np.zeros(T)
+            return {
+                "status": "Optimal",
+                "profit": 0.0,
+                "plan": self._plan(prices, dates, idle, idle.copy(), idle.copy())
+            }
+        
+        h = self._highs
+        h.changeColsCost(2 * T, self._cost_cols, np.concatenate([-cost_coef, prices]))
+        
+        # Solve the problem (warm-started from the previous basis, if any)
+        h.run()
+        
+        # Check status
+        if h.getModelStatus() != highspy.HighsModelStatus.kOptimal:
+            return {"status": "Infeasible", "profit": None, "plan": None}
+        
+        # Extract results
+        x = np.asarray(h.getSolution().col_value)
+        x = np.where(np.abs(x) < 1e-9, 0.0, x)  # Drop solver noise and signed zeros (-0.0)
+        plan = self._plan(prices, dates, x[:T], x[T:2 * T], x[2 * T:])
+        
+        profit = h.getInfo().objective_function_value
+        
+        return {
+            "status": "Optimal",
+            "profit": profit,
+            "plan": plan
+        }
+    
+    def _plan(self, prices: np.ndarray, dates: np.ndarray, inject: np.ndarray,
+              withdraw: np.ndarray, storage: np.ndarray) -> Dict[str, np.ndarray]:
+        """Assemble the plan columns, in the order they are written to CSV."""
+        plan = {"day_index": np.arange(self.num_days)}
+        if dates is not None:
+            plan["date"] = np.asarray(dates)
+        plan.update({
+            "price": prices,
+            "inject": inject,
+            "withdraw": withdraw,
+            "storage": storage
+        })
+        return plan
+
 
 def optimize_ugs_plan(forward_curve: pd.DataFrame, 
                      wgv: float = 1_000_000,
@@ -21,6 +233,10 @@ def optimize_ugs_plan(forward_curve: pd.DataFrame,
     """
     Optimize injection/withdrawal plan using linear programming.
     
+    The injection curve is linearized (no binary variables), so the model is
+    a pure LP and is solved with a single simplex call. To solve many price
+    curves with the same storage parameters, build a UGSModel once instead.
+    
     Args:
         forward_curve: DataFrame with columns ['date', 'price', 'day_index'].
         wgv: Working gas volume (MWh).
@@ -34,87 +250,10 @@ def optimize_ugs_plan(forward_curve: pd.DataFrame,
         variable_cost_rate: Variable cost as fraction of injected gas cost.
         
     Returns:
-        Dictionary with optimization results: profit, plan, and status.
+        Dictionary with optimization results: profit, plan, and status. The
+        plan is a dict of NumPy arrays keyed by column name.
     """
-    # Extract data
-    prices = forward_curve['price'].values
-    T = len(forward_curve)  # Number of days (365)
-    
-    # Initialize PuLP problem
-    prob = pulp.LpProblem("UGS_Optimization", pulp.LpMaximize)
-    
-    # Variables
-    inject = [pulp.LpVariable(f"inject_{t}", lowBound=0) for t in range(T)]
-    withdraw = [pulp.LpVariable(f"withdraw_{t}", lowBound=0) for t in range(T)]
-    storage = [pulp.LpVariable(f"storage_{t}", lowBound=0, upBound=wgv) for t in range(T)]
-    
-    # Binary variables for injection curve (storage < 50% or >= 50%)
-    is_first_half = [pulp.LpVariable(f"is_first_half_{t}", cat='Binary') for t in range(T)]
-    
-    # Objective: Maximize profit
-    # Profit = Revenue from withdrawals - Cost of injections - Variable costs
-    revenue = pulp.lpSum(withdraw[t] * prices[t] for t in range(T))
-    cost = pulp.lpSum(inject[t] * prices[t] * (1 + variable_cost_rate) for t in range(T))
-    prob += revenue - cost, "Total_Profit"
-    
-    # Constraints
-    # 1. Storage balance
-    for t in range(T):
-        if t == 0:
-            prob += storage[t] == inject[t] - withdraw[t], f"Storage_Balance_0"
-        else:
-            prob += storage[t] == storage[t-1] + inject[t] - withdraw[t], f"Storage_Balance_{t}"
-    
-    # 2. Initial and final storage (flexible, but non-negative)
-    prob += storage[0] >= 0, "Initial_Storage"
-    
-    # 3. Injection constraints (based on storage level)
-    M = wgv * 2  # Big-M for binary constraints
-    for t in range(T):
-        # If storage[t-1] < threshold * wgv, is_first_half[t] = 1
-        prob += storage[t-1] - injection_threshold * wgv <= M * (1 - is_first_half[t]), f"First_Half_Upper_{t}"
-        prob += storage[t-1] - injection_threshold * wgv >= -M * is_first_half[t], f"First_Half_Lower_{t}"
-        
-        # Injection rate based on is_first_half
-        prob += inject[t] <= max_injection_rate * (
-            is_first_half[t] * injection_first_half +
-            (1 - is_first_half[t]) * injection_second_half
-        ), f"Injection_Rate_{t}"
-        
-        # Ensure injection doesn't exceed available capacity
-        prob += inject[t] <= wgv - storage[t-1], f"Injection_Capacity_{t}"
-    
-    # 4. Withdrawal constraints (linear based on storage level)
-    for t in range(T):
-        fill_percentage = pulp.LpVariable(f"fill_{t}", lowBound=0, upBound=1)
-        prob += fill_percentage * wgv == storage[t-1], f"Fill_Percentage_{t}"  # Fixed: Rewritten division
-        prob += withdraw[t] <= max_withdrawal_rate * (
-            withdrawal_min_factor +
-            (withdrawal_max_factor - withdrawal_min_factor) * fill_percentage
-        ), f"Withdrawal_Rate_{t}"
-        prob += withdraw[t] <= storage[t-1], f"Withdrawal_Capacity_{t}"
-    
-    # Solve the problem
-    prob.solve(pulp.PULP_CBC_CMD(msg=0))  # Use CBC solver, suppress output
-    
-    # Check status
-    if pulp.LpStatus[prob.status] != 'Optimal':
-        return {"status": "Infeasible", "profit": None, "plan": None}
-    
-    # Extract results
-    plan = {
-        "day_index": list(range(T)),
-        "date": forward_curve['date'].tolist(),
-        "price": prices.tolist(),
-        "inject": [pulp.value(inject[t]) for t in range(T)],
-        "withdraw": [pulp.value(withdraw[t]) for t in range(T)],
-        "storage": [pulp.value(storage[t]) for t in range(T)]
-    }
-    
-    profit = pulp.value(prob.objective)
-    
-    return {
-        "status": pulp.LpStatus[prob.status],
-        "profit": profit,
-        "plan": pd.DataFrame(plan)
-    }
\ No newline at end of file
+    model = UGSModel(len(forward_curve), wgv, max_injection_rate, max_withdrawal_rate,
+                     injection_threshold, injection_first_half, injection_second_half,
+                     withdrawal_min_factor, withdrawal_max_factor, variable_cost_rate)
+    return model.solve(forward_curve['price'].to_numpy(dtype=float), forward_curve['date'].to_numpy())
@@ -4,6 +4,7 @@ Generate bidding strategy and injection/withdrawal plan for UGS auction.
 """
 
 from typing import Dict, Any
+import numpy as np
 import pandas as pd
 
 def calculate_bid_and_plan(optimization_result: Dict, bid_fraction: float = 0.8, wgv: float = 1_000_000) -> Dict[str, Any]:
@@ -36,14 +37,17 @@ def calculate_bid_and_plan(optimization_result: Dict, bid_fraction: float = 0.8,
     # Get plan
     plan = optimization_result["plan"]
     
-    # Summary metrics
-    total_injected = plan["inject"].sum()
-    total_withdrawn = plan["withdraw"].sum()
-    max_storage = plan["storage"].max()
-    final_storage = plan["storage"].iloc[-1]
-    injection_days = (plan["inject"] > 0).sum()
-    withdrawal_days = (plan["withdraw"] > 0).sum()
-    hold_days = ((plan["inject"] == 0) & (plan["withdraw"] == 0)).sum()
+    # Summary metrics (on the raw arrays, avoiding pandas overhead)
+    inj = np.asarray(plan["inject"])
+    wd = np.asarray(plan["withdraw"])
+    st = np.asarray(plan["storage"])
+    total_injected = inj.sum()
+    total_withdrawn = wd.sum()
+    max_storage = st.max()
+    final_storage = st[-1]
+    injection_days = int(np.count_nonzero(inj > 0))
+    withdrawal_days = int(np.count_nonzero(wd > 0))
+    hold_days = int(np.count_nonzero((inj == 0) & (wd == 0)))
     
     return {
         "bid_per_mwh": bid_per_mwh,
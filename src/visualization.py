@@ -3,7 +3,10 @@
 Visualize UGS auction optimization results.
 """
 
+import matplotlib
+matplotlib.use("Agg")  # Plots are only saved to file, so skip GUI backend detection
 import matplotlib.pyplot as plt
+import numpy as np
 import os
 from typing import Dict, Any
 
@@ -21,8 +24,8 @@ def plot_results(result: Dict[str, Any], save_dir: str = "results") -> None:
     fig, axs = plt.subplots(3, 1, figsize=(12, 15), sharex=True)
     
     # Plot forward curve
-    days = plan["day_index"]
-    prices = plan["price"]
+    days = np.asarray(plan["day_index"])
+    prices = np.asarray(plan["price"])
     axs[0].plot(days, prices, color='blue', label='Forward Curve')
     axs[0].set_ylabel('Price (€/MWh)')
     axs[0].set_title('Forward Curve')
@@ -30,8 +33,8 @@ def plot_results(result: Dict[str, Any], save_dir: str = "results") -> None:
     axs[0].grid(True)
     
     # Plot actions (injection/withdrawal)
-    injections = plan["inject"]
-    withdrawals = plan["withdraw"]
+    injections = np.asarray(plan["inject"])
+    withdrawals = np.asarray(plan["withdraw"])
     axs[1].bar(days, injections, color='green', label='Injection')
     axs[1].bar(days, -withdrawals, color='red', label='Withdrawal')
     axs[1].set_ylabel('Volume (MWh)')
@@ -40,7 +43,7 @@ def plot_results(result: Dict[str, Any], save_dir: str = "results") -> None:
     axs[1].grid(True)
     
     # Plot storage level
-    storage = plan["storage"]
+    storage = np.asarray(plan["storage"])
     axs[2].plot(days, storage, color='purple', label='Storage Level')
     axs[2].set_xlabel('Day')
     axs[2].set_ylabel('Storage Level (MWh)')
@@ -0,0 +1,81 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_loader import load_forward_curve
+from src.greedy import optimize_ugs_plan_greedy, value_ugs_scenarios
+from src.optimizer import optimize_ugs_plan
+
+WGV = 1_000_000
+MAX_INJECTION_RATE = 20_000
+MAX_WITHDRAWAL_RATE = 30_000
+TOL = 1e-6
+DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "UTF-8fwcurve.csv")
+
+
+def _curve(prices):
+    return pd.DataFrame({
+        "date": pd.date_range("2026-04-01", periods=len(prices), freq="D"),
+        "price": prices,
+    })
+
+
+def _curves():
+    bundled, _ = load_forward_curve(DATA_PATH)
+    days = np.arange(365)
+    rng = np.random.default_rng(0)
+    return {
+        "bundled": bundled,
+        "reversed": _curve(bundled["price"].to_numpy()[::-1]),
+        "seasonal": _curve(30 + 8 * np.cos(2 * np.pi * days / 365)),
+        "noisy": _curve(30 + rng.normal(0, 3, 365)),
+    }
+
+
+@pytest.fixture(params=list(_curves().items()), ids=lambda item: item[0])
+def forward_curve(request):
+    return request.param[1]
+
+
+def test_greedy_plan_respects_caps(forward_curve):
+    plan = optimize_ugs_plan_greedy(forward_curve)["plan"]
+    inject, withdraw, storage = plan["inject"], plan["withdraw"], plan["storage"]
+    storage_prev = np.concatenate(([0.0], storage[:-1]))
+    
+    # Storage balance and capacity
+    np.testing.assert_allclose(storage, np.cumsum(inject - withdraw), atol=TOL)
+    assert (storage >= -TOL).all() and (storage <= WGV + TOL).all()
+    assert (inject >= 0).all() and (withdraw >= 0).all()
+    
+    # Injection: full rate at empty, down to 70% at half full (same linear cut as the LP)
+    injection_cap = np.minimum(
+        MAX_INJECTION_RATE,
+        MAX_INJECTION_RATE * (0.7 + 0.3 * (0.5 * WGV - storage_prev) / (0.5 * WGV))
+    )
+    assert (inject <= np.maximum(injection_cap, 0.0) + TOL).all()
+    assert (inject <= WGV - storage_prev + TOL).all()
+    
+    # Withdrawal: 40% of the rate at empty, 100% at full, never more than stored
+    withdrawal_cap = MAX_WITHDRAWAL_RATE * (0.4 + 0.6 * storage_prev / WGV)
+    assert (withdraw <= withdrawal_cap + TOL).all()
+    assert (withdraw <= storage_prev + TOL).all()
+
+
+def test_greedy_profit_bounded_by_lp(forward_curve):
+    greedy = optimize_ugs_plan_greedy(forward_curve)
+    lp = optimize_ugs_plan(forward_curve)
+    assert greedy["status"] == "Feasible"
+    
+    plan = greedy["plan"]
+    cost = plan["inject"] @ (plan["price"] * 1.012)
+    assert greedy["profit"] == pytest.approx(plan["withdraw"] @ plan["price"] - cost)
+    assert greedy["profit"] <= lp["profit"] + TOL
+
+
+def test_value_ugs_scenarios_matches_single_runs():
+    curves = list(_curves().values())
+    scenarios = np.stack([curve["price"].to_numpy() for curve in curves])
+    expected = [optimize_ugs_plan_greedy(curve)["profit"] for curve in curves]
+    np.testing.assert_allclose(value_ugs_scenarios(scenarios), expected)
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from src.optimizer import UGSModel
+
+T = 365
+TOL = 1e-6
+
+
+class _CountingHighs:
+    """Wrap a Highs instance and count calls to run()."""
+    
+    def __init__(self, highs):
+        self._highs = highs
+        self.runs = 0
+    
+    def run(self):
+        self.runs += 1
+        return self._highs.run()
+    
+    def __getattr__(self, name):
+        return getattr(self._highs, name)
+
+
+def _counting_model():
+    model = UGSModel(T)
+    model._highs = _CountingHighs(model._highs)
+    return model
+
+
+def _highs_profit(prices):
+    """Solve with HiGHS directly, bypassing the no-spread shortcut."""
+    model = UGSModel(T)
+    cost_coef = prices * (1 + model.variable_cost_rate)
+    model._highs.changeColsCost(2 * T, model._cost_cols, np.concatenate([-cost_coef, prices]))
+    model._highs.run()
+    return model._highs.getInfo().objective_function_value
+
+
+def test_falling_curve_is_short_circuited():
+    prices = np.linspace(40.0, 20.0, T)
+    model = _counting_model()
+    result = model.solve(prices)
+    
+    assert model._highs.runs == 0
+    assert result["status"] == "Optimal"
+    assert result["profit"] == 0.0
+    assert not result["plan"]["inject"].any() and not result["plan"]["withdraw"].any()
+    assert _highs_profit(prices) == pytest.approx(0.0, abs=TOL)
+
+
+def test_single_profitable_day_is_solved():
+    prices = np.full(T, 30.0)
+    prices[200] = 30.0 * 1.012 + 0.01
+    model = _counting_model()
+    model.solve(np.linspace(40.0, 20.0, T))  # Short-circuited solve first
+    result = model.solve(prices)
+    
+    assert model._highs.runs == 1
+    assert result["profit"] > 0
+    assert result["profit"] == pytest.approx(UGSModel(T).solve(prices)["profit"])
+    assert result["profit"] == pytest.approx(_highs_profit(prices))
+
+
+def test_negative_price_is_not_short_circuited():
+    # Falling curve, so no withdrawal is ever profitable, but being paid to
+    # inject on the last day still is
+    prices = np.linspace(40.0, 20.0, T)
+    prices[-1] = -5.0
+    model = _counting_model()
+    result = model.solve(prices)
+    
+    assert model._highs.runs == 1
+    assert result["profit"] > 0
+    assert result["profit"] == pytest.approx(_highs_profit(prices))